@@ -0,0 +1,12 @@
+import multiprocessing
+import os
+
+# /transcript is an async view run through asgiref's AsyncToSync, which needs
+# its own OS thread per request, so use threaded workers rather than gevent
+# (greenlets share one thread and concurrent requests fail). Blocking caption
+# and Whisper calls already run off the event loop via asyncio.to_thread.
+bind = f"0.0.0.0:{os.environ.get('PORT', 10000)}"
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get("GUNICORN_THREADS", 16))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 120))
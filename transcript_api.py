@@ -1,45 +1,184 @@
+import asyncio
+import hashlib
 import os
 import re
 import tempfile
+import threading
+import time
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+
+import orjson
+import redis
+import requests
+from requests.adapters import HTTPAdapter
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+from rq import Queue
+from rq.exceptions import NoSuchJobError
+from rq.job import Job, JobStatus
 
 from youtube_transcript_api import (
-    YouTubeTranscriptApi,
     TranscriptsDisabled,
     NoTranscriptFound,
     CouldNotRetrieveTranscript,
 )
+from youtube_transcript_api._transcripts import TranscriptListFetcher
 import yt_dlp
 from openai import OpenAI
 
+try:
+    # optional: google-re2 gives linear-time DFA matching for URL parsing
+    import re2 as url_re
+except ImportError:
+    url_re = re
+
 # ====== config ======
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 client = OpenAI(api_key=OPENAI_API_KEY)
 
+# One keep-alive session for all caption traffic to youtube.com, instead of
+# the fresh Session YouTubeTranscriptApi.list_transcripts opens per call.
+http_session = requests.Session()
+http_session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+# Caption transcripts are cached in-process; set REDIS_URL to share them
+# across workers and restarts.
+CACHE_SIZE = int(os.environ.get("TRANSCRIPT_CACHE_SIZE", 4096))
+CACHE_TTL = int(os.environ.get("TRANSCRIPT_CACHE_TTL", 24 * 3600))
+REDIS_URL = os.environ.get("REDIS_URL")
+redis_client = redis.Redis.from_url(REDIS_URL, decode_responses=False) if REDIS_URL else None
+
+# With Redis configured, the Whisper fallback runs on an RQ worker
+# (`rq worker whisper`) and /transcript answers 202 with a job id to poll.
+WHISPER_JOB_TIMEOUT = int(os.environ.get("WHISPER_JOB_TIMEOUT", 900))
+WHISPER_ENQUEUE_WAIT = int(os.environ.get("WHISPER_ENQUEUE_WAIT", 10))
+whisper_queue = Queue("whisper", connection=redis_client) if redis_client else None
+
+# Start the audio download for the Whisper fallback while captions are still
+# being probed. Costs bandwidth on videos that turn out to have captions.
+SPECULATIVE_AUDIO = os.environ.get("SPECULATIVE_AUDIO") == "1"
+CAPTION_GRACE_SECONDS = float(os.environ.get("CAPTION_GRACE_SECONDS", 1.5))
+AUDIO_PREFETCH_WORKERS = int(os.environ.get("AUDIO_PREFETCH_WORKERS", 4))
+
+# Every PREFETCH_INTERVAL seconds, re-warm the caption cache for recently
+# requested videos so they stay hot. 0 disables the background thread.
+PREFETCH_INTERVAL = float(os.environ.get("PREFETCH_INTERVAL", 0))
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson (used by jsonify and get_json).
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 
 # ---------- helpers ----------
 
+# watch?v=, embed/, shorts/, v/ and youtu.be/ URLs in one pass
+_VIDEO_ID_RE = url_re.compile(
+    r"(?:youtube\.com/(?:watch\?(?:.*&)?v=|embed/|shorts/|v/)|youtu\.be/)([0-9A-Za-z_-]{11})"
+)
+
+# Deletes every valid id character, so a valid id translates to ""
+_STRIP_ID_CHARS = str.maketrans(
+    "", "", "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_-"
+)
+
+
+def _is_video_id(s: str) -> bool:
+    return len(s) == 11 and not s.translate(_STRIP_ID_CHARS)
+
+
+def _id_at(url: str, i: int) -> str | None:
+    """
+    The 11-char video id starting at url[i], if that slice is one.
+    """
+    candidate = url[i:i + 11]
+    return candidate if _is_video_id(candidate) else None
+
+
+def _scan_video_id(url: str) -> str | None:
+    """
+    str.find fast path for plain youtu.be/, youtube.com/shorts/ and
+    youtube.com/watch?...v= URLs. Anything else returns None and is left to
+    _VIDEO_ID_RE.
+    """
+    for scheme in ("https://", "http://"):
+        if url.startswith(scheme):
+            url = url[len(scheme):]
+            break
+
+    if url.startswith("youtu.be/"):
+        return _id_at(url, 9)
+
+    for host in ("www.youtube.com/", "m.youtube.com/", "youtube.com/"):
+        if url.startswith(host):
+            path = url[len(host):]
+            break
+    else:
+        return None
+
+    if path.startswith("shorts/"):
+        return _id_at(path, 7)
+
+    if path.startswith("watch?"):
+        query = path[6:]
+        if query.startswith("v="):
+            return _id_at(query, 2)
+        i = query.find("&v=")
+        if i >= 0:
+            return _id_at(query, i + 3)
+    return None
+
+
+# Longer inputs are parsed but not memoized, so junk can't bloat the cache
+MAX_CACHED_URL_LENGTH = 2048
+
+
 def extract_video_id(video_url: str) -> str | None:
     """
     Extract YouTube video ID from a full URL or just return the ID if given.
     """
+    if len(video_url) <= MAX_CACHED_URL_LENGTH:
+        return _extract_video_id_cached(video_url)
+    return _extract_video_id(video_url)
+
+
+@lru_cache(maxsize=8192)
+def _extract_video_id_cached(video_url: str) -> str | None:
+    return _extract_video_id(video_url)
+
+
+def _extract_video_id(video_url: str) -> str | None:
     # If they already give just the ID
-    if re.fullmatch(r"[0-9A-Za-z_-]{11}", video_url):
+    if _is_video_id(video_url):
         return video_url
 
-    # Common URL patterns
-    patterns = [
-        r"youtube\.com/watch\?v=([0-9A-Za-z_-]{11})",
-        r"youtu\.be/([0-9A-Za-z_-]{11})",
-        r"youtube\.com/embed/([0-9A-Za-z_-]{11})",
-    ]
-    for p in patterns:
-        m = re.search(p, video_url)
-        if m:
-            return m.group(1)
-    return None
+    video_id = _scan_video_id(video_url)
+    if video_id:
+        return video_id
+
+    m = _VIDEO_ID_RE.search(video_url)
+    return m.group(1) if m else None
+
+
+# "00".."99" for format_time, avoiding f-string format specs per segment
+_TWO_DIGITS = [f"{i:02d}" for i in range(100)]
 
 
 def format_time(seconds: float) -> str:
@@ -47,26 +186,50 @@ def format_time(seconds: float) -> str:
     Convert seconds -> HH:MM:SS
     """
     seconds = int(seconds)
-    h = seconds // 3600
-    m = (seconds % 3600) // 60
-    s = seconds % 60
+    h, rem = divmod(seconds, 3600)
+    m, s = divmod(rem, 60)
+    if 0 <= h < 100:
+        return _TWO_DIGITS[h] + ":" + _TWO_DIGITS[m] + ":" + _TWO_DIGITS[s]
     return f"{h:02d}:{m:02d}:{s:02d}"
 
 
-def build_timed_transcript_from_youtube(video_id: str) -> dict:
+def join_timed_lines(entries: Sequence[tuple[float, str]]) -> str:
+    """
+    (start, text) pairs -> "HH:MM:SS\ntext" blocks separated by blank lines.
+    Entries with empty text are dropped.
     """
-    First try to fetch YouTube captions and format them as:
+    # Preallocated block list + inlined format_time: this runs once per
+    # segment, tens of thousands of times for long videos.
+    blocks = [None] * len(entries)
+    n = 0
+    for start, text in entries:
+        if not text:
+            continue
+        h, rem = divmod(int(start), 3600)
+        m, s = divmod(rem, 60)
+        if 0 <= h < 100:
+            blocks[n] = f"{_TWO_DIGITS[h]}:{_TWO_DIGITS[m]}:{_TWO_DIGITS[s]}\n{text}"
+        else:
+            blocks[n] = f"{format_time(start)}\n{text}"
+        n += 1
+    del blocks[n:]
+    return "\n\n".join(blocks)
+
+
+def fetch_youtube_captions(video_id: str, languages: tuple[str, ...]) -> str:
+    """
+    Fetch YouTube captions and format them as:
     00:00:00 Text...
     00:00:04 Next line...
     """
     try:
-        transcripts = YouTubeTranscriptApi.list_transcripts(video_id)
+        transcripts = TranscriptListFetcher(http_session).fetch(video_id)
 
         # Prefer manually created subtitles, otherwise auto-generated
         try:
-            transcript_obj = transcripts.find_manually_created_transcript(["en"])
+            transcript_obj = transcripts.find_manually_created_transcript(languages)
         except NoTranscriptFound:
-            transcript_obj = transcripts.find_generated_transcript(["en"])
+            transcript_obj = transcripts.find_generated_transcript(languages)
 
         raw = transcript_obj.fetch()
     except (TranscriptsDisabled, NoTranscriptFound, CouldNotRetrieveTranscript) as e:
@@ -74,23 +237,160 @@ def build_timed_transcript_from_youtube(video_id: str) -> dict:
     except Exception as e:
         raise e
 
-    lines = []
-    for entry in raw:
-        t = format_time(entry["start"])
-        text = entry["text"].replace("\n", " ").strip()
-        if text:
-            lines.append(f"{t}\n{text}")
+    return join_timed_lines(
+        [(entry["start"], entry["text"].replace("\n", " ").strip()) for entry in raw]
+    )
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def cached_youtube_captions(video_id: str, languages: tuple[str, ...]) -> str:
+    """
+    fetch_youtube_captions behind the in-process LRU and, if configured, Redis.
+    Failures are not cached, so videos that gain captions later are picked up.
+    """
+    if redis_client is None:
+        return fetch_youtube_captions(video_id, languages)
+
+    key = f"captions:{video_id}:{','.join(languages)}"
+    try:
+        hit = redis_client.get(key)
+    except redis.RedisError as e:
+        print("Redis cache read failed:", e)
+        hit = None
+    if hit is not None:
+        return hit.decode("utf-8")
+
+    text = fetch_youtube_captions(video_id, languages)
+    try:
+        redis_client.setex(key, CACHE_TTL, text.encode("utf-8"))
+    except redis.RedisError as e:
+        print("Redis cache write failed:", e)
+    return text
+
+
+# Caption fetches currently running, so concurrent requests for the same
+# video share one upstream call. Requests may run on different event loops,
+# hence thread-safe futures rather than asyncio ones.
+_inflight: dict[tuple[str, tuple[str, ...]], Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _claim_inflight(key: tuple[str, tuple[str, ...]]) -> tuple[Future, bool]:
+    """
+    The in-flight future for `key`, and whether the caller just created it
+    (and so must resolve it and release the key).
+    """
+    with _inflight_lock:
+        fut = _inflight.get(key)
+        if fut is not None:
+            return fut, False
+        fut = _inflight[key] = Future()
+        # a cancelled waiter must not cancel the shared fetch
+        fut.set_running_or_notify_cancel()
+        return fut, True
+
+
+def _release_inflight(key: tuple[str, tuple[str, ...]]) -> None:
+    with _inflight_lock:
+        del _inflight[key]
 
+
+async def fetch_youtube_captions_coalesced(video_id: str, languages: tuple[str, ...]) -> str:
+    """
+    cached_youtube_captions, but callers that arrive while a fetch for the same
+    key is running wait for that result instead of starting their own.
+    """
+    key = (video_id, languages)
+    fut, owner = _claim_inflight(key)
+    if not owner:
+        return await asyncio.wrap_future(fut)
+
+    try:
+        text = await asyncio.to_thread(cached_youtube_captions, video_id, languages)
+    except BaseException as e:
+        fut.set_exception(e)
+        raise
+    else:
+        fut.set_result(text)
+        remember_recent(video_id, languages)
+        return text
+    finally:
+        _release_inflight(key)
+
+
+async def build_timed_transcript_from_youtube(
+    video_id: str, languages: tuple[str, ...] = ("en",)
+) -> dict:
+    """
+    First try YouTube captions (cached per video_id + languages).
+    """
     return {
         "source": "youtube_captions",
         "video_id": video_id,
-        "transcript": "\n\n".join(lines),
+        "transcript": await fetch_youtube_captions_coalesced(video_id, languages),
     }
 
 
-def download_audio(video_url: str, temp_dir: str) -> str:
+# Recently served caption keys, newest last
+_recent: deque[tuple[str, tuple[str, ...]]] = deque(maxlen=256)
+_prefetch_thread: threading.Thread | None = None
+_prefetch_lock = threading.Lock()
+
+
+def remember_recent(video_id: str, languages: tuple[str, ...]) -> None:
+    """
+    Record a served video for the prefetcher, starting it on first use.
+    """
+    global _prefetch_thread
+
+    if PREFETCH_INTERVAL <= 0:
+        return
+    _recent.append((video_id, languages))
+
+    with _prefetch_lock:
+        if _prefetch_thread is None:
+            _prefetch_thread = threading.Thread(
+                target=prefetch_recent_loop, name="caption-prefetch", daemon=True
+            )
+            _prefetch_thread.start()
+
+
+def prefetch_recent_loop() -> None:
+    """
+    Keep recent videos in the caption cache: hits just refresh their LRU
+    position, entries evicted since the last pass are fetched again.
+    """
+    while True:
+        time.sleep(PREFETCH_INTERVAL)
+        for key in dict.fromkeys(list(_recent)):
+            try:
+                prefetch_captions(key)
+            except Exception as e:
+                print("Error prefetching captions:", key[0], e)
+
+
+def prefetch_captions(key: tuple[str, tuple[str, ...]]) -> None:
+    """
+    Refresh one caption key through the in-flight map: skipped if a request
+    is already fetching it, and requests arriving meanwhile wait on this fetch.
+    """
+    fut, owner = _claim_inflight(key)
+    if not owner:
+        return
+
+    try:
+        fut.set_result(cached_youtube_captions(*key))
+    except BaseException as e:
+        fut.set_exception(e)
+        raise
+    finally:
+        _release_inflight(key)
+
+
+def download_audio(video_url: str, temp_dir: str, cancel: threading.Event | None = None) -> str:
     """
     Use yt-dlp to download audio only and return filepath.
+    Setting `cancel` aborts the download at the next progress update.
     """
     filename = os.path.join(temp_dir, "audio.m4a")
 
@@ -101,12 +401,69 @@ def download_audio(video_url: str, temp_dir: str) -> str:
         "noplaylist": True,
     }
 
+    if cancel is not None:
+        def abort_if_cancelled(_status):
+            if cancel.is_set():
+                raise yt_dlp.utils.DownloadCancelled()
+
+        ydl_opts["progress_hooks"] = [abort_if_cancelled]
+
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
         ydl.download([video_url])
 
     return filename
 
 
+# Dedicated pool so an abandoned download never holds up the request's event
+# loop shutdown (asyncio.to_thread would use the loop's default executor).
+_audio_pool = ThreadPoolExecutor(max_workers=AUDIO_PREFETCH_WORKERS)
+
+
+class AudioPrefetch:
+    """
+    Speculative download_audio running next to the caption probe.
+    Always call discard() once done with it; the temp dir is removed when the
+    download thread finishes.
+    """
+
+    def __init__(self, video_url: str):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self._cancel = threading.Event()
+        self._future = _audio_pool.submit(
+            download_audio, video_url, self._tmpdir.name, self._cancel
+        )
+
+    async def audio_path(self) -> str:
+        return await asyncio.wrap_future(self._future)
+
+    def discard(self) -> None:
+        self._cancel.set()
+        self._future.add_done_callback(lambda _: self._tmpdir.cleanup())
+
+
+def transcribe_audio(audio_path: str, video_id: str) -> dict:
+    """
+    Call OpenAI Whisper on a downloaded audio file, then build time-coded text.
+    """
+    with open(audio_path, "rb") as f:
+        # Use verbose_json to get segments with timestamps
+        result = client.audio.transcriptions.create(
+            model="whisper-1",
+            file=f,
+            response_format="verbose_json",
+        )
+
+    segments = result.segments or []
+
+    return {
+        "source": "whisper_fallback",
+        "video_id": video_id,
+        "transcript": join_timed_lines(
+            [(float(seg.get("start", 0.0)), seg.get("text", "").strip()) for seg in segments]
+        ),
+    }
+
+
 def build_timed_transcript_from_whisper(video_url: str, video_id: str) -> dict:
     """
     Fallback: download audio + call OpenAI Whisper, then build time-coded text.
@@ -120,30 +477,119 @@ def build_timed_transcript_from_whisper(video_url: str, video_id: str) -> dict:
 
     with tempfile.TemporaryDirectory() as tmpdir:
         audio_path = download_audio(video_url, tmpdir)
+        return transcribe_audio(audio_path, video_id)
 
-        with open(audio_path, "rb") as f:
-            # Use verbose_json to get segments with timestamps
-            result = client.audio.transcriptions.create(
-                model="whisper-1",
-                file=f,
-                response_format="verbose_json",
-            )
 
-        segments = result.segments or []
+def transcript_response(result: dict):
+    """
+    200 + ETag for a finished transcript, or an empty 304 if the client's
+    If-None-Match already has this exact content.
+    """
+    etag = hashlib.blake2b(
+        f"{result['source']}:{result['video_id']}:{result['video_url']}:"
+        f"{result['transcript']}".encode(),
+        digest_size=8,
+    ).hexdigest()
 
-    lines = []
-    for seg in segments:
-        start = float(seg.get("start", 0.0))
-        t = format_time(start)
-        text = seg.get("text", "").strip()
-        if text:
-            lines.append(f"{t}\n{text}")
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+    else:
+        response = jsonify(result)
+    response.set_etag(etag)
+    return response
 
-    return {
-        "source": "whisper_fallback",
-        "video_id": video_id,
-        "transcript": "\n\n".join(lines),
-    }
+
+def _reusable_whisper_job(job_id: str) -> Job | None:
+    """
+    The existing job for `job_id` if it is pending or finished successfully.
+    """
+    try:
+        job = Job.fetch(job_id, connection=redis_client)
+    except NoSuchJobError:
+        return None
+
+    status = job.get_status()
+    if status in (JobStatus.FAILED, JobStatus.STOPPED, JobStatus.CANCELED):
+        return None
+    # an error result (e.g. worker without OPENAI_API_KEY) is requeued
+    # like a failure rather than served for the whole result_ttl
+    if status == JobStatus.FINISHED and job.return_value().get("source") == "error":
+        return None
+    return job
+
+
+def enqueue_whisper_job(video_url: str, video_id: str) -> Job:
+    """
+    Queue build_timed_transcript_from_whisper on the worker. A pending or
+    successfully finished job for the same video is reused rather than
+    queued again; a short Redis lock makes sure only one caller (across all
+    workers) queues it while the others attach to that job.
+    """
+    job_id = f"whisper-{video_id}"
+    lock_key = f"lock:{job_id}"
+    deadline = time.monotonic() + WHISPER_ENQUEUE_WAIT
+
+    while True:
+        job = _reusable_whisper_job(job_id)
+        if job is not None:
+            return job
+
+        if redis_client.set(lock_key, 1, nx=True, ex=WHISPER_ENQUEUE_WAIT):
+            try:
+                # someone may have queued it between our check and the lock
+                job = _reusable_whisper_job(job_id)
+                if job is not None:
+                    return job
+                return whisper_queue.enqueue(
+                    build_timed_transcript_from_whisper,
+                    video_url,
+                    video_id,
+                    job_id=job_id,
+                    job_timeout=WHISPER_JOB_TIMEOUT,
+                    result_ttl=CACHE_TTL,
+                )
+            finally:
+                redis_client.delete(lock_key)
+
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"Timed out waiting for {job_id} to be queued")
+        time.sleep(0.05)
+
+
+def whisper_job_response(job: Job, video_url: str | None = None):
+    """
+    200 + transcript once the job is done, 202 while it is pending.
+    `video_url` defaults to the URL the job was first queued with.
+    """
+    job_video_url, video_id = job.args
+    video_url = video_url or job_video_url
+    status = job.get_status()
+
+    if status == JobStatus.FINISHED:
+        result = dict(job.return_value())
+        result["video_url"] = video_url
+        if result.get("source") == "error":
+            return jsonify(result), 500
+        return transcript_response(result)
+
+    if status in (JobStatus.FAILED, JobStatus.STOPPED, JobStatus.CANCELED):
+        return jsonify(
+            {
+                "error": "Failed to generate transcript from captions or audio.",
+                "job_id": job.id,
+                "video_id": video_id,
+                "video_url": video_url,
+            }
+        ), 500
+
+    return jsonify(
+        {
+            "job_id": job.id,
+            "status": status,
+            "video_id": video_id,
+            "video_url": video_url,
+        }
+    ), 202
 
 
 # ---------- routes ----------
@@ -155,9 +601,16 @@ def health():
 
 
 @app.route("/transcript", methods=["POST"])
-def transcript():
-    data = request.get_json(silent=True) or {}
-    video_url = data.get("video_url")
+async def transcript():
+    raw = request.get_data(cache=False)
+    if not raw:
+        return jsonify({"error": "Missing 'video_url' in JSON body"}), 400
+
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        data = None
+    video_url = data.get("video_url") if isinstance(data, dict) else None
 
     if not video_url:
         return jsonify({"error": "Missing 'video_url' in JSON body"}), 400
@@ -166,33 +619,69 @@ def transcript():
     if not video_id:
         return jsonify({"error": "Could not extract video_id from URL"}), 400
 
-    # 1) try YouTube captions
+    captions = asyncio.ensure_future(build_timed_transcript_from_youtube(video_id))
+    prefetch = None
+    if SPECULATIVE_AUDIO and OPENAI_API_KEY and whisper_queue is None:
+        done, _ = await asyncio.wait({captions}, timeout=CAPTION_GRACE_SECONDS)
+        if not done:
+            # captions are slow or missing – get the audio download going
+            prefetch = AudioPrefetch(video_url)
+
     try:
-        yt_result = build_timed_transcript_from_youtube(video_id)
-        yt_result["video_url"] = video_url
-        return jsonify(yt_result), 200
-    except (TranscriptsDisabled, NoTranscriptFound, CouldNotRetrieveTranscript):
-        # no captions – fall through to Whisper
-        pass
-    except Exception as e:
-        # unexpected error – log and still try Whisper
-        print("Error fetching YouTube transcript:", e)
+        # 1) try YouTube captions
+        try:
+            yt_result = await captions
+            yt_result["video_url"] = video_url
+            return transcript_response(yt_result)
+        except (TranscriptsDisabled, NoTranscriptFound, CouldNotRetrieveTranscript):
+            # no captions – fall through to Whisper
+            pass
+        except Exception as e:
+            # unexpected error – log and still try Whisper
+            print("Error fetching YouTube transcript:", e)
+
+        # 2) fallback to Whisper
+        try:
+            if whisper_queue is not None:
+                job = await asyncio.to_thread(enqueue_whisper_job, video_url, video_id)
+                return whisper_job_response(job, video_url)
+
+            if prefetch is not None:
+                audio_path = await prefetch.audio_path()
+                whisper_result = await asyncio.to_thread(transcribe_audio, audio_path, video_id)
+            else:
+                whisper_result = await asyncio.to_thread(
+                    build_timed_transcript_from_whisper, video_url, video_id
+                )
+            whisper_result["video_url"] = video_url
+            if whisper_result.get("source") == "error":
+                return jsonify(whisper_result), 500
+            return transcript_response(whisper_result)
+        except Exception as e:
+            print("Error in Whisper fallback:", e)
+            return jsonify(
+                {
+                    "error": "Failed to generate transcript from captions or audio.",
+                    "video_id": video_id,
+                    "video_url": video_url,
+                }
+            ), 500
+    finally:
+        if prefetch is not None:
+            prefetch.discard()
+
+
+@app.route("/transcript/<job_id>", methods=["GET"])
+def transcript_job(job_id):
+    if whisper_queue is None:
+        return jsonify({"error": "Background transcription is not enabled"}), 404
 
-    # 2) fallback to Whisper
     try:
-        whisper_result = build_timed_transcript_from_whisper(video_url, video_id)
-        whisper_result["video_url"] = video_url
-        status = 200 if whisper_result.get("source") != "error" else 500
-        return jsonify(whisper_result), status
-    except Exception as e:
-        print("Error in Whisper fallback:", e)
-        return jsonify(
-            {
-                "error": "Failed to generate transcript from captions or audio.",
-                "video_id": video_id,
-                "video_url": video_url,
-            }
-        ), 500
+        job = Job.fetch(job_id, connection=redis_client)
+    except NoSuchJobError:
+        return jsonify({"error": "Unknown job_id"}), 404
+
+    return whisper_job_response(job)
 
 
 if __name__ == "__main__":